@@ -25,6 +25,26 @@ from ..core.messages import (Event, ImageContent, MessageEndEvent,
                              TurnStartEvent)
 from ..tools.builtin.base import ToolResult
 
+_PROMPT_SESSION: Optional[PromptSession] = None
+
+
+def _shared_prompt_session() -> PromptSession:
+    """Return the process-wide prompt session, creating it on first use.
+
+    Creating a PromptSession sets up key bindings, styles and terminal
+    probing, so renderers share one instead of building their own. It is
+    created lazily so importing this module has no terminal side effects.
+    """
+    global _PROMPT_SESSION
+    if _PROMPT_SESSION is None:
+        # Initialize prompt session with better unicode support
+        _PROMPT_SESSION = PromptSession(
+            style=Style.from_dict({
+                'prompt': '#0066cc bold',  # Blue bold for prompt
+            })
+        )
+    return _PROMPT_SESSION
+
 
 class CLIRenderer:
     """Render agent events to terminal."""
@@ -40,12 +60,8 @@ class CLIRenderer:
         self.current_reasoning = {}  # Track reasoning blocks
         self.reasoning_just_ended = False  # Track if reasoning just ended
 
-        # Initialize prompt session with better unicode support
-        self.prompt_session = PromptSession(
-            style=Style.from_dict({
-                'prompt': '#0066cc bold',  # Blue bold for prompt
-            })
-        )
+        # Prompt session is shared across renderers (see _shared_prompt_session)
+        self.prompt_session = _shared_prompt_session()
 
     def render_event(self, event: Event) -> None:
         """Render an event to the console."""
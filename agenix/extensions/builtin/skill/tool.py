@@ -4,12 +4,182 @@ This tool implements the "Skills as Tools" design pattern, allowing agents to
 load specialized instructions on-demand.
 """
 
-import yaml
+import functools
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 
 from ....tools.builtin.base import Tool, ToolResult
 
+# Below this many uncached SKILL.md files, reading serially beats starting a
+# thread pool
+_PARALLEL_SCAN_THRESHOLD = 4
+
+# SKILL.md path -> ((mtime_ns, size), name); an edited file replaces its
+# entry, so the cache holds one entry per skill file seen
+_NAME_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+
+
+# Leading "---" block closed by a line that is exactly "---"
+_FRONTMATTER_RE = re.compile(r"\A---\r?\n(?:(.*?)\r?\n)?---[ \t]*(?:\r?\n|\Z)", re.S)
+
+# Lines the fast path understands: an unquoted plain key, ": ", a value
+_FLAT_LINE_RE = re.compile(r"([A-Za-z_][\w-]*): +(.*)")
+
+# Value prefixes that need a real YAML parser: block scalars, flow
+# collections, anchors/aliases, tags and the other YAML indicators that
+# cannot start a plain scalar (including reserved "@" and "`")
+_YAML_VALUE_PREFIXES = (
+    ">", "|", "[", "]", "{", "}", ",", "&", "*", "!", "@", "`", "%", "#", "?", ":",
+)
+
+# Plain scalars YAML would resolve to a non-string (numbers, dates, bools,
+# null); these also go to the YAML parser so both paths agree
+_YAML_TYPED_SCALAR_RE = re.compile(
+    r"[-+.0-9~]|(?:null|true|false|yes|no|on|off)\Z", re.I
+)
+
+
+def _fast_frontmatter(text: str) -> Optional[Dict[str, str]]:
+    """Parse flat ``key: value`` frontmatter without PyYAML.
+
+    Args:
+        text: Frontmatter block between the ``---`` markers
+
+    Returns:
+        Dict of string values, or None if the block needs full YAML parsing
+    """
+    metadata = {}
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = _FLAT_LINE_RE.fullmatch(line.rstrip())
+        if not match:
+            return None
+
+        key, value = match.groups()
+        if value.startswith(_YAML_VALUE_PREFIXES) or " #" in value:
+            return None
+
+        quote = value[0]
+        if len(value) >= 2 and value[-1] == quote and quote in "'\"":
+            value = value[1:-1]
+            # Inner quotes ('' escapes) and backslash sequences need YAML
+            if quote in value or "\\" in value:
+                return None
+        elif (quote in "'\"" or ": " in value or value.endswith(":")
+              or _YAML_TYPED_SCALAR_RE.match(value)):
+            return None
+
+        metadata[key] = value
+
+    return metadata
+
+
+def _split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Split SKILL.md content into its frontmatter block and body.
+
+    Args:
+        content: Full SKILL.md text
+
+    Returns:
+        (frontmatter, body), or (None, content) if the file does not start
+        with a ``---`` block closed by a line containing only ``---``
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None, content
+
+    return match.group(1) or "", content[match.end():]
+
+
+def _read_small(path: str) -> str:
+    """Read a small UTF-8 text file with raw os calls.
+
+    SKILL.md files are typically a few KB, so the first read usually
+    returns the whole file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    return b"".join(chunks).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> type:
+    """Import PyYAML on first use and return its fastest safe loader class.
+
+    Most frontmatter is handled by _fast_frontmatter, so PyYAML is only
+    imported when a SKILL.md needs real YAML.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(text: str) -> Any:
+    """Parse a YAML document with the loader from _yaml_loader()."""
+    # Same steps as yaml.load, without needing the yaml module here
+    loader = _yaml_loader()(text)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def _parse_frontmatter_name(path: str) -> Optional[str]:
+    """Parse the ``name`` field from a SKILL.md frontmatter.
+
+    Returns:
+        The frontmatter name as a string, or None if absent or unparsable
+    """
+    try:
+        content = _read_small(path)
+
+        frontmatter, _ = _split_frontmatter(content)
+        if frontmatter is not None:
+            metadata = _fast_frontmatter(frontmatter)
+            if metadata is None:
+                metadata = _yaml_load(frontmatter)
+            name = metadata.get("name") if metadata else None
+            if name is not None:
+                # YAML may type the value (e.g. ``name: 123``); names are keys
+                return str(name)
+    except Exception:
+        pass
+
+    return None
+
+
+def _is_name_cached(path: str, st: os.stat_result) -> bool:
+    """Check whether path's name is cached for its current mtime and size."""
+    cached = _NAME_CACHE.get(path)
+    return cached is not None and cached[0] == (st.st_mtime_ns, st.st_size)
+
+
+def _cached_frontmatter_name(path: str, st: os.stat_result) -> Optional[str]:
+    """Return the frontmatter name of path, parsing it only if it changed.
+
+    Rebuilding a SkillTool skips unchanged files while edited files are
+    parsed again.
+    """
+    if not _is_name_cached(path, st):
+        _NAME_CACHE[path] = ((st.st_mtime_ns, st.st_size), _parse_frontmatter_name(path))
+    return _NAME_CACHE[path][1]
+
 
 class SkillTool(Tool):
     """Skill Tool - Load specialized instructions from SKILL.md files.
@@ -57,33 +227,43 @@ class SkillTool(Tool):
         # Scan available skills
         self._available_skills = self._scan_skills()
 
-        # Build tool description
-        skill_list = ", ".join(sorted(self._available_skills.keys()))
-        if not skill_list:
-            skill_list = "No skills available"
+        # Sorted once for the description, enum and not-found errors
+        self._sorted_names = sorted(self._available_skills)
 
         super().__init__(
             name="skill",
-            description=f"""Load a skill to get specialized instructions for specific tasks.
+            description=self._build_description(),
+            parameters=self._build_parameters()
+        )
+
+    def _build_description(self) -> str:
+        """Build the tool description listing available skills."""
+        skill_list = ", ".join(self._sorted_names)
+        if not skill_list:
+            skill_list = "No skills available"
+
+        return f"""Load a skill to get specialized instructions for specific tasks.
 
 Skills provide detailed, step-by-step instructions for common workflows like
 creating git commits, reviewing PRs, writing tests, etc.
 
 Available skills: {skill_list}
 
-Use this tool when you need detailed instructions for a specialized task.""",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "skill_name": {
-                        "type": "string",
-                        "description": "Name of the skill to load",
-                        "enum": list(self._available_skills.keys()) if self._available_skills else ["no-skills"]
-                    }
-                },
-                "required": ["skill_name"]
-            }
-        )
+Use this tool when you need detailed instructions for a specialized task."""
+
+    def _build_parameters(self) -> Dict[str, Any]:
+        """Build the parameter schema with skill names as enum."""
+        return {
+            "type": "object",
+            "properties": {
+                "skill_name": {
+                    "type": "string",
+                    "description": "Name of the skill to load",
+                    "enum": list(self._sorted_names) if self._sorted_names else ["no-skills"]
+                }
+            },
+            "required": ["skill_name"]
+        }
 
     def _scan_skills(self) -> Dict[str, Path]:
         """Scan all directories for available skills.
@@ -95,45 +275,71 @@ Use this tool when you need detailed instructions for a specialized task.""",
 
         # Scan from lowest to highest priority (later overrides earlier)
         for skill_dir in self.skill_dirs:
-            if not skill_dir.exists():
-                continue
+            skills.update(self._scan_dir(skill_dir))
+
+        return skills
+
+    def _scan_dir(self, skill_dir: Path) -> Dict[str, Path]:
+        """Scan a single directory for available skills.
+
+        Args:
+            skill_dir: Directory containing <name>/SKILL.md entries
 
-            for item in skill_dir.iterdir():
-                if not item.is_dir():
+        Returns:
+            Dict mapping skill name to SKILL.md path
+        """
+        skills = {}
+        candidates = []
+
+        try:
+            entries = os.scandir(skill_dir)
+        except OSError:
+            return skills
+
+        # DirEntry.is_dir() uses the readdir file type, avoiding a stat per entry
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
                     continue
 
-                skill_file = item / "SKILL.md"
-                if skill_file.exists():
-                    # Parse skill name from frontmatter
-                    name = self._parse_skill_name(skill_file)
-                    skills[name] = skill_file
+                skill_file = os.path.join(entry.path, "SKILL.md")
+                try:
+                    st = os.stat(skill_file)
+                except OSError:
+                    continue
 
-        return skills
+                candidates.append((skill_file, st))
 
-    def _parse_skill_name(self, skill_file: Path) -> str:
+        # Parse new or edited files up front, overlapping reads only when
+        # enough of them miss the cache; the rest are plain dict lookups
+        misses = [c for c in candidates if not _is_name_cached(*c)]
+        if len(misses) >= _PARALLEL_SCAN_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as pool:
+                list(pool.map(lambda c: _cached_frontmatter_name(*c), misses))
+
+        names = [self._parse_skill_name(path, st) for path, st in candidates]
+
+        # Later duplicates win; Path objects are only built for the skills kept.
+        # Names are interned since they are reused as dict keys on every lookup.
+        kept = dict(zip(map(sys.intern, names), (skill_file for skill_file, _ in candidates)))
+        return {name: Path(skill_file) for name, skill_file in kept.items()}
+
+    def _parse_skill_name(self, skill_file: str, st: os.stat_result) -> str:
         """Parse skill name from SKILL.md frontmatter.
 
         Args:
             skill_file: Path to SKILL.md
+            st: Stat result of skill_file, used to validate the name cache
 
         Returns:
             Skill name (fallback to directory name)
         """
-        try:
-            content = skill_file.read_text()
-
-            # Parse YAML frontmatter
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    metadata = yaml.safe_load(parts[1])
-                    if metadata and "name" in metadata:
-                        return metadata["name"]
-        except Exception:
-            pass
+        name = _cached_frontmatter_name(skill_file, st)
+        if name:
+            return name
 
         # Fallback to directory name
-        return skill_file.parent.name
+        return os.path.basename(os.path.dirname(skill_file))
 
     async def execute(
         self,
@@ -151,18 +357,19 @@ Use this tool when you need detailed instructions for a specialized task.""",
         Returns:
             ToolResult with skill instructions
         """
-        skill_name = arguments.get("skill_name", "")
-
-        if not skill_name:
+        missing = self._require(arguments, "skill_name")
+        if missing:
             return ToolResult(
-                content="Error: skill_name parameter is required",
+                content=f"Error: {missing} parameter is required",
                 is_error=True
             )
 
+        skill_name = arguments["skill_name"]
+
         # Find skill file
         skill_file = self._available_skills.get(skill_name)
         if not skill_file:
-            available = ", ".join(sorted(self._available_skills.keys()))
+            available = ", ".join(self._sorted_names)
             return ToolResult(
                 content=f"Error: Skill '{skill_name}' not found.\n\nAvailable skills: {available}",
                 is_error=True
@@ -176,10 +383,9 @@ Use this tool when you need detailed instructions for a specialized task.""",
             content = skill_file.read_text()
 
             # Remove YAML frontmatter (agent doesn't need to see it)
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    content = parts[2].strip()
+            frontmatter, body = _split_frontmatter(content)
+            if frontmatter is not None:
+                content = body.strip()
 
             # Format result
             result = f"""**Skill '{skill_name}' loaded successfully**
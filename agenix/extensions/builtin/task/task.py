@@ -96,16 +96,17 @@ The subagent will have access to the same tools and will execute independently."
         Returns:
             ToolResult with subagent's output
         """
-        task = arguments.get("task", "")
-        context = arguments.get("context", "")
-
         # Validate arguments
-        if not task:
+        missing = self._require(arguments, "task")
+        if missing:
             return ToolResult(
-                content="Error: task parameter is required",
+                content=f"Error: {missing} parameter is required",
                 is_error=True
             )
 
+        task = arguments["task"]
+        context = arguments.get("context", "")
+
         # Report start
         if on_update:
             on_update("Starting subagent...")
@@ -54,6 +54,14 @@ class Tool(ABC):
             "parameters": self.parameters,
         }
 
+    @staticmethod
+    def _require(arguments: Dict[str, Any], *keys: str) -> Optional[str]:
+        """Return the first of keys that is missing, None or empty, else None."""
+        for key in keys:
+            if arguments.get(key) in (None, ""):
+                return key
+        return None
+
     def validate_arguments(self, arguments: Dict[str, Any]) -> None:
         """Validate tool arguments against schema."""
         required = self.parameters.get("required", [])
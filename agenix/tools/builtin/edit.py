@@ -132,7 +132,8 @@ class EditTool(Tool):
                 details={
                     "diff": diff,
                     "first_changed_line": first_changed_line,
-                    "replacements": count
+                    "replacements": count,
+                    "new_content": new_content
                 }
             )
 
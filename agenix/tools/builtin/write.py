@@ -1,11 +1,19 @@
 """Write file tool."""
 
+import asyncio
 import os
 from typing import Any, Callable, Dict, Optional
 
 from .base import Tool, ToolResult
 
 
+def _write_file(file_path: str, content: str) -> None:
+    """Create parent directories if needed and write content to file_path."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
 class WriteTool(Tool):
     """Write content to a file."""
 
@@ -40,10 +48,11 @@ class WriteTool(Tool):
         on_update: Optional[Callable[[str], None]] = None,
     ) -> ToolResult:
         """Execute write operation."""
-        # Validate arguments
-        if "file_path" not in arguments:
+        # Validate arguments; empty content is valid (it truncates the file)
+        missing = self._require(arguments, "file_path")
+        if missing:
             return ToolResult(
-                content="Error: Missing required argument 'file_path'. Please provide the path to the file you want to write.",
+                content=f"Error: Missing required argument '{missing}'. Please provide the path to the file you want to write.",
                 is_error=True
             )
 
@@ -61,12 +70,9 @@ class WriteTool(Tool):
             file_path = os.path.join(self.working_dir, file_path)
 
         try:
-            # Create parent directories if needed
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            # Write file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Blocking disk I/O runs in the default executor, off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_file, file_path, content)
 
             lines = len(content.split('\n'))
             return ToolResult(
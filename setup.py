@@ -20,8 +20,9 @@ requirements = [
 
 dev_requirements = [
     "pytest>=7.4.0",
-    "pytest-asyncio>=0.21.0",
+    "pytest-asyncio>=0.24.0",
     "pytest-cov>=4.1.0",
+    "pytest-xdist>=3.3.0",
 ]
 
 docs_requirements = [
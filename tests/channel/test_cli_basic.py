@@ -29,6 +29,12 @@ class TestCLIBasics:
 
         assert renderer is not None
 
+    def test_renderers_share_prompt_session(self):
+        """Test that renderers reuse one prompt session."""
+        from agenix.channel.tui import CLIRenderer
+
+        assert CLIRenderer().prompt_session is CLIRenderer().prompt_session
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,15 +1,20 @@
 """Test configuration for pytest.
 
 This module configures pytest for the agenix test suite.
+
+Independent tool calls within one test can be awaited together with
+``asyncio.gather`` instead of one after another.
 """
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pytest_asyncio import is_async_test
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -25,6 +30,11 @@ if env_file.exists():
                 key, value = line.split("=", 1)
                 os.environ.setdefault(key.strip(), value.strip())
 
+# Opt-in: keep temp files (including pytest's tmp_path) on tmpfs
+if os.environ.get("AGENIX_TEST_TMPFS") == "1":
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        tempfile.tempdir = "/dev/shm"
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers.
@@ -43,6 +53,21 @@ def pytest_configure(config):
     )
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session-scoped event loop.
+
+    Equivalent to asyncio_default_test_loop_scope = session, which needs
+    pytest-asyncio 0.26 and therefore Python 3.9+.
+
+    Args:
+        items: Collected test items
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 # Import after path setup
 from agenix.core.llm import LLMProvider, StreamEvent
 from agenix.core.messages import AssistantMessage, TextContent, ToolCall, Usage
@@ -122,3 +147,13 @@ def mock_provider_with_tool_call():
         arguments={"arg": "value"}
     )
     return MockLLMProvider(tool_calls=[tool_call])
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """Per-test scratch directory managed by pytest (replaces mkdtemp/rmtree).
+
+    This is already a Path, so build file paths as ``temp_dir / "name"``
+    rather than wrapping it in ``Path(...)`` again.
+    """
+    return tmp_path
@@ -3,8 +3,6 @@
 import tempfile
 from pathlib import Path
 
-import pytest
-
 from agenix.extensions.tool_registry import ToolConfig, ToolRegistry
 
 
@@ -123,6 +121,3 @@ class TestToolRegistry:
         assert len(ToolRegistry._tools) == 0
         assert not ToolRegistry._initialized
 
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,10 +3,25 @@
 This module contains unit tests for the base Tool interface.
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from agenix.core.messages import TextContent
-from agenix.tools.base import Tool, ToolResult
+from agenix.tools import Tool, ToolResult
+
+
+# Read-only schemas shared by all tests
+_SCHEMA_WITH_PROPS = MappingProxyType({
+    "type": "object",
+    "properties": MappingProxyType({
+        "arg1": MappingProxyType({"type": "string"})
+    })
+})
+_SCHEMA_REQUIRED = MappingProxyType({
+    "type": "object",
+    "required": ("arg1", "arg2")
+})
 
 
 class DummyTool(Tool):
@@ -49,6 +64,16 @@ class TestToolResult:
         assert result.is_error is True
 
 
+@pytest.fixture(scope="module")
+def dummy_tool():
+    """Shared DummyTool instance."""
+    return DummyTool(
+        name="test",
+        description="Test",
+        parameters=_SCHEMA_REQUIRED
+    )
+
+
 class TestTool:
     """Test cases for Tool base class."""
 
@@ -57,7 +82,7 @@ class TestTool:
         tool = DummyTool(
             name="test",
             description="A test tool",
-            parameters={"type": "object"}
+            parameters=_SCHEMA_WITH_PROPS
         )
 
         assert tool.name == "test"
@@ -69,12 +94,7 @@ class TestTool:
         tool = DummyTool(
             name="test",
             description="A test tool",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "arg1": {"type": "string"}
-                }
-            }
+            parameters=_SCHEMA_WITH_PROPS
         )
 
         tool_dict = tool.to_dict()
@@ -83,44 +103,33 @@ class TestTool:
         assert tool_dict["description"] == "A test tool"
         assert "properties" in tool_dict["parameters"]
 
-    def test_validate_arguments_success(self):
-        """Test validating correct arguments."""
-        tool = DummyTool(
-            name="test",
-            description="Test",
-            parameters={
-                "type": "object",
-                "required": ["arg1", "arg2"]
-            }
-        )
-
-        # Should not raise
-        tool.validate_arguments({"arg1": "value1", "arg2": "value2"})
-
-    def test_validate_arguments_missing_required(self):
-        """Test validating arguments with missing required field."""
-        tool = DummyTool(
-            name="test",
-            description="Test",
-            parameters={
-                "type": "object",
-                "required": ["arg1", "arg2"]
-            }
-        )
-
-        with pytest.raises(ValueError, match="Missing required argument"):
-            tool.validate_arguments({"arg1": "value1"})
+    @pytest.mark.parametrize("arguments,ok", [
+        ({"arg1": "value1", "arg2": "value2"}, True),
+        ({"arg1": "value1"}, False),
+    ])
+    def test_validate_arguments(self, dummy_tool, arguments, ok):
+        """Test validating arguments against required fields."""
+        if ok:
+            # Should not raise
+            dummy_tool.validate_arguments(arguments)
+        else:
+            with pytest.raises(ValueError, match="Missing required argument"):
+                dummy_tool.validate_arguments(arguments)
+
+    @pytest.mark.parametrize("arguments,missing", [
+        ({"arg1": "a", "arg2": "b"}, None),
+        ({"arg2": "b"}, "arg1"),
+        ({"arg1": "a", "arg2": ""}, "arg2"),
+        ({"arg1": None, "arg2": "b"}, "arg1"),
+    ])
+    def test_require(self, arguments, missing):
+        """Test that _require reports the first missing or empty key."""
+        assert Tool._require(arguments, "arg1", "arg2") == missing
 
     @pytest.mark.asyncio
-    async def test_execute_tool(self):
+    async def test_execute_tool(self, dummy_tool):
         """Test executing a tool."""
-        tool = DummyTool(
-            name="test",
-            description="Test",
-            parameters={}
-        )
-
-        result = await tool.execute(
+        result = await dummy_tool.execute(
             tool_call_id="call_123",
             arguments={}
         )
@@ -129,20 +138,14 @@ class TestTool:
         assert result.is_error is False
 
     @pytest.mark.asyncio
-    async def test_execute_with_callback(self):
+    async def test_execute_with_callback(self, dummy_tool):
         """Test executing tool with progress callback."""
         updates = []
 
         def on_update(msg):
             updates.append(msg)
 
-        tool = DummyTool(
-            name="test",
-            description="Test",
-            parameters={}
-        )
-
-        result = await tool.execute(
+        result = await dummy_tool.execute(
             tool_call_id="call_123",
             arguments={},
             on_update=on_update
@@ -150,6 +153,3 @@ class TestTool:
 
         assert result is not None
 
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,9 +3,17 @@
 This module contains unit tests for the bash command execution tool.
 """
 
+import asyncio
+
 import pytest
 
-from agenix.tools.bash import BashTool
+from agenix.tools import BashTool
+
+
+@pytest.fixture(scope="module")
+def bash_tool():
+    """Shared BashTool; execute() keeps no per-call state."""
+    return BashTool(working_dir=".")
 
 
 class TestBashTool:
@@ -18,52 +26,27 @@ class TestBashTool:
         assert tool.name == "bash"
         assert "bash" in tool.description.lower()
         assert "command" in tool.parameters["properties"]
+        assert tool.parameters["required"] == ["command"]
+        assert tool.parameters["properties"]["timeout"]["default"] == 60
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_execute_simple_command(self):
-        """Test executing a simple command."""
-        tool = BashTool(working_dir=".")
-
-        result = await tool.execute(
-            tool_call_id="call_123",
-            arguments={"command": "echo hello"}
-        )
-
-        assert result.is_error is False
-        assert "hello" in result.content.lower()
-        assert result.details["exit_code"] == 0
-
-    @pytest.mark.asyncio
-    async def test_execute_command_with_output(self):
-        """Test command with stdout output."""
-        tool = BashTool(working_dir=".")
-
-        result = await tool.execute(
+    async def test_execute_command_with_output(self, bash_tool):
+        """Test command output handling."""
+        result = await bash_tool.execute(
             tool_call_id="call_123",
             arguments={"command": "echo 'test output'"}
         )
 
+        assert result.is_error is False
         assert "test output" in result.content
+        assert result.details["exit_code"] == 0
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_execute_failing_command(self):
-        """Test command that fails."""
-        tool = BashTool(working_dir=".")
-
-        result = await tool.execute(
-            tool_call_id="call_123",
-            arguments={"command": "exit 1"}
-        )
-
-        assert result.is_error is True
-        assert result.details["exit_code"] == 1
-
-    @pytest.mark.asyncio
-    async def test_execute_nonexistent_command(self):
+    async def test_execute_nonexistent_command(self, bash_tool):
         """Test executing a command that doesn't exist."""
-        tool = BashTool(working_dir=".")
-
-        result = await tool.execute(
+        result = await bash_tool.execute(
             tool_call_id="call_123",
             arguments={"command": "nonexistent_command_xyz"}
         )
@@ -71,38 +54,35 @@ class TestBashTool:
         # Should either be error or non-zero exit code
         assert result.is_error is True or result.details.get("exit_code") != 0
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_working_directory(self):
+    async def test_working_directory(self, tmp_path):
         """Test that command executes in correct working directory."""
-        import os
-        import tempfile
-
-        temp_dir = tempfile.mkdtemp()
-        try:
-            tool = BashTool(working_dir=temp_dir)
-
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={"command": "pwd"}
-            )
-
-            assert temp_dir in result.content
-        finally:
-            os.rmdir(temp_dir)
-
-    @pytest.mark.asyncio
-    async def test_command_with_stderr(self):
-        """Test command that writes to stderr."""
-        tool = BashTool(working_dir=".")
+        tool = BashTool(working_dir=str(tmp_path))
 
         result = await tool.execute(
             tool_call_id="call_123",
-            arguments={"command": "echo 'error' >&2"}
+            arguments={"command": "pwd"}
         )
 
-        # Should capture stderr
-        assert "Stderr" in result.content or "error" in result.content
+        assert str(tmp_path) in result.content
 
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_concurrent_execution(self, bash_tool):
+        """Test running several commands concurrently on one tool."""
+        commands = ["echo hello", "exit 1", "echo 'error' >&2"]
+
+        ok, failed, stderr = await asyncio.gather(*(
+            bash_tool.execute(tool_call_id=f"call_{i}", arguments={"command": command})
+            for i, command in enumerate(commands)
+        ))
+
+        assert ok.is_error is False
+        assert "hello" in ok.content
+        assert ok.details["exit_code"] == 0
+        assert failed.is_error is True
+        assert failed.details["exit_code"] == 1
+        # Should capture stderr
+        assert "Stderr" in stderr.content and "error" in stderr.content
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
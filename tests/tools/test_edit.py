@@ -3,26 +3,25 @@
 This module contains unit tests for the edit file tool.
 """
 
-import shutil
-import tempfile
-from pathlib import Path
+import re
 
 import pytest
 
-from agenix.tools.edit import EditTool
+from agenix.tools import EditTool
+
+# Arguments shared by the tests that edit test.txt
+_EDIT_ARGS = {"file_path": "test.txt"}
+
+_COULD_NOT_FIND = re.compile(r"could not find", re.IGNORECASE).search
 
 
 class TestEditTool:
     """Test cases for EditTool class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if hasattr(self, 'temp_dir'):
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def tool(self, tmp_path):
+        """EditTool rooted at this test's directory."""
+        return EditTool(working_dir=str(tmp_path))
 
     def test_create_edit_tool(self):
         """Test creating an edit tool instance."""
@@ -35,158 +34,80 @@ class TestEditTool:
         assert "new_string" in tool.parameters["properties"]
 
     @pytest.mark.asyncio
-    async def test_simple_edit(self):
+    async def test_simple_edit(self, tool, tmp_path):
         """Test simple string replacement."""
-        self.setUp()
-        try:
-            # Create test file
-            test_file = Path(self.temp_dir) / "test.py"
-            test_file.write_text("def old_function():\n    pass\n")
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.py",
-                    "old_string": "old_function",
-                    "new_string": "new_function"
-                }
-            )
-
-            assert result.is_error is False
-            assert "Successfully replaced" in result.content
-
-            # Verify edit
-            content = test_file.read_text()
-            assert "new_function" in content
-            assert "old_function" not in content
-        finally:
-            self.tearDown()
-
-    @pytest.mark.asyncio
-    async def test_edit_preserves_whitespace(self):
-        """Test that edit preserves exact whitespace."""
-        self.setUp()
-        try:
-            test_file = Path(self.temp_dir) / "test.py"
-            original = "def function():\n    return 42\n"
-            test_file.write_text(original)
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.py",
-                    "old_string": "    return 42",
-                    "new_string": "    return 100"
-                }
-            )
-
-            assert result.is_error is False
-            content = test_file.read_text()
-            assert "return 100" in content
-        finally:
-            self.tearDown()
+        # Create test file
+        test_file = tmp_path / "test.py"
+        test_file.write_bytes(b"def old_function():\n    pass\n")
+
+        result = await tool.execute(
+            tool_call_id="call_123",
+            arguments={
+                "file_path": "test.py",
+                "old_string": "old_function",
+                "new_string": "new_function"
+            }
+        )
+
+        assert result.is_error is False
+        assert "Successfully replaced" in result.content
+
+        # Verify edit; the file on disk must match what the tool reports
+        content = result.details["new_content"]
+        assert "new_function" in content
+        assert "old_function" not in content
+        assert test_file.read_bytes() == content.encode("ascii")
 
     @pytest.mark.asyncio
-    async def test_edit_generates_diff(self):
+    async def test_edit_generates_diff(self, tool, tmp_path):
         """Test that edit generates a diff."""
-        self.setUp()
-        try:
-            test_file = Path(self.temp_dir) / "test.txt"
-            test_file.write_text("Hello World")
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.txt",
-                    "old_string": "World",
-                    "new_string": "Python"
-                }
-            )
-
-            # Check that details include diff
-            assert result.details is not None
-            assert "diff" in result.details
-        finally:
-            self.tearDown()
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"Hello World")
 
-    @pytest.mark.asyncio
-    async def test_edit_string_not_found(self):
-        """Test edit when old_string is not found."""
-        self.setUp()
-        try:
-            test_file = Path(self.temp_dir) / "test.txt"
-            test_file.write_text("Hello World")
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.txt",
-                    "old_string": "Goodbye",
-                    "new_string": "Hello"
-                }
-            )
-
-            assert result.is_error is True
-            assert "could not find" in result.content.lower()
-        finally:
-            self.tearDown()
+        result = await tool.execute(
+            tool_call_id="call_123",
+            arguments={**_EDIT_ARGS, "old_string": "World", "new_string": "Python"}
+        )
 
-    @pytest.mark.asyncio
-    async def test_edit_replace_all(self):
-        """Test replacing all occurrences."""
-        self.setUp()
-        try:
-            test_file = Path(self.temp_dir) / "test.txt"
-            test_file.write_text("foo bar foo baz foo")
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.txt",
-                    "old_string": "foo",
-                    "new_string": "qux",
-                    "replace_all": True
-                }
-            )
-
-            assert result.is_error is False
-            content = test_file.read_text()
-            assert content.count("qux") == 3
-            assert "foo" not in content
-        finally:
-            self.tearDown()
+        # Check that details include diff
+        assert result.details is not None
+        assert "diff" in result.details
 
     @pytest.mark.asyncio
-    async def test_edit_replace_first_only(self):
-        """Test replacing only first occurrence."""
-        self.setUp()
-        try:
-            test_file = Path(self.temp_dir) / "test.txt"
-            test_file.write_text("foo bar foo baz")
-
-            tool = EditTool(working_dir=self.temp_dir)
-            result = await tool.execute(
-                tool_call_id="call_123",
-                arguments={
-                    "file_path": "test.txt",
-                    "old_string": "foo",
-                    "new_string": "qux",
-                    "replace_all": False
-                }
-            )
-
-            assert result.is_error is False
-            content = test_file.read_text()
-            # Should have one qux and one remaining foo
-            assert content.count("qux") == 1
-            assert content.count("foo") == 1
-        finally:
-            self.tearDown()
+    async def test_edit_string_not_found(self, tool, tmp_path):
+        """Test edit when old_string is not found."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"Hello World")
+
+        result = await tool.execute(
+            tool_call_id="call_123",
+            arguments={**_EDIT_ARGS, "old_string": "Goodbye", "new_string": "Hello"}
+        )
+
+        assert result.is_error is True
+        assert _COULD_NOT_FIND(result.content)
+
+    @pytest.mark.parametrize("original,old,new,replace_all,expected", [
+        pytest.param("def function():\n    return 42\n", "    return 42", "    return 100", False,
+                     "def function():\n    return 100\n", id="preserves_whitespace"),
+        pytest.param("foo bar foo baz foo", "foo", "qux", True,
+                     "qux bar qux baz qux", id="replace_all"),
+        pytest.param("foo bar foo baz", "foo", "qux", False,
+                     "qux bar foo baz", id="replace_first_only"),
+    ])
+    @pytest.mark.asyncio
+    async def test_edit_replacements(self, tool, tmp_path,
+                                     original, old, new, replace_all, expected):
+        """Test replacement results for whitespace, replace_all and first-only edits."""
+        (tmp_path / "test.txt").write_bytes(original.encode())
+
+        result = await tool.execute(
+            tool_call_id="call_123",
+            arguments={**_EDIT_ARGS, "old_string": old, "new_string": new, "replace_all": replace_all}
+        )
+
+        assert result.is_error is False
+        assert result.details["new_content"] == expected
 
 
 if __name__ == "__main__":
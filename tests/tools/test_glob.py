@@ -1,106 +1,93 @@
 """Tests for GlobTool - File pattern matching tool."""
 
+import asyncio
+import operator
 import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from agenix.tools.glob import GlobTool
+from agenix.tools import GlobTool
 
+# Files created under the shared TestGlobTool tree
+_TREE_FILES = (
+    "file1.py", "file2.py", "test.txt", "data.json",
+    "src/main.py", "src/utils.py", "src/config.yaml",
+    "tests/test_main.py", "tests/test_utils.py",
+    "docs/readme.md", "docs/api.md",
+    "src/components/button.js", "src/components/input.js",
+)
 
-class TestGlobTool:
-    """Test cases for GlobTool."""
+# Patterns shared across the TestGlobTool cases
+_PATTERNS = {
+    "py": "*.py",
+    "py_rec": "**/*.py",
+    "md_rec": "**/*.md",
+    "js_rec": "**/*.js",
+    "yaml_rec": "**/*.yaml",
+}
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory with test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
 
-            # Create test file structure
-            (tmp_path / "file1.py").touch()
-            (tmp_path / "file2.py").touch()
-            (tmp_path / "test.txt").touch()
-            (tmp_path / "data.json").touch()
+@pytest.fixture(scope="module")
+def glob_tree(tmp_path_factory):
+    """Create a temporary directory with test files.
 
-            # Create subdirectories
-            (tmp_path / "src").mkdir()
-            (tmp_path / "src" / "main.py").touch()
-            (tmp_path / "src" / "utils.py").touch()
-            (tmp_path / "src" / "config.yaml").touch()
+    Built once per module; tests using it must not modify it.
+    """
+    tmp_path = tmp_path_factory.mktemp("glob")
+    base = str(tmp_path)
 
-            (tmp_path / "tests").mkdir()
-            (tmp_path / "tests" / "test_main.py").touch()
-            (tmp_path / "tests" / "test_utils.py").touch()
+    # Create test file structure with raw os calls on string paths
+    for rel in ("src/components", "tests", "docs"):
+        os.makedirs(f"{base}/{rel}")
+    for rel in _TREE_FILES:
+        fd = os.open(f"{base}/{rel}", os.O_WRONLY | os.O_CREAT, 0o644)
+        os.close(fd)
 
-            (tmp_path / "docs").mkdir()
-            (tmp_path / "docs" / "readme.md").touch()
-            (tmp_path / "docs" / "api.md").touch()
+    return tmp_path
 
-            # Create nested structure
-            (tmp_path / "src" / "components").mkdir()
-            (tmp_path / "src" / "components" / "button.js").touch()
-            (tmp_path / "src" / "components" / "input.js").touch()
 
-            yield tmp_path
+class TestGlobTool:
+    """Test cases for GlobTool."""
 
+    @pytest.fixture
+    def tool(self, glob_tree):
+        """GlobTool rooted at the shared test tree."""
+        return GlobTool(working_dir=str(glob_tree))
+
+    @pytest.mark.parametrize("pattern,expected,forbidden,count", [
+        (_PATTERNS["py"], ["file1.py", "file2.py"], ["test.txt"], 2),
+        (_PATTERNS["py_rec"], ["file1.py", "main.py", "test_main.py"], [], 6),
+        ("src/**/*.py", ["main.py", "utils.py"], ["test_main.py"], 2),
+        (_PATTERNS["md_rec"], ["readme.md", "api.md"], [], 2),
+        (_PATTERNS["js_rec"], ["button.js", "input.js"], [], 2),
+        ("file*", ["file1.py", "file2.py"], [], 2),
+        (_PATTERNS["yaml_rec"], ["config.yaml"], [], 1),
+    ])
     @pytest.mark.asyncio
-    async def test_simple_pattern(self, temp_dir):
-        """Test simple glob pattern matching."""
-        tool = GlobTool(working_dir=temp_dir)
-
+    async def test_pattern(self, tool, pattern, expected, forbidden, count):
+        """Test that a glob pattern matches exactly the expected files."""
         result = await tool.execute(
             tool_call_id="test1",
-            arguments={"pattern": "*.py"}
-        )
-
-        assert not result.is_error
-        assert "file1.py" in result.content
-        assert "file2.py" in result.content
-        assert "test.txt" not in result.content
-
-    @pytest.mark.asyncio
-    async def test_recursive_pattern(self, temp_dir):
-        """Test recursive glob pattern with **."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        result = await tool.execute(
-            tool_call_id="test2",
-            arguments={"pattern": "**/*.py"}
-        )
-
-        assert not result.is_error
-        assert "file1.py" in result.content
-        assert "main.py" in result.content or "src/main.py" in result.content
-        assert "test_main.py" in result.content or "tests/test_main.py" in result.content
-        assert result.details["count"] >= 6  # At least 6 Python files
-
-    @pytest.mark.asyncio
-    async def test_nested_recursive_pattern(self, temp_dir):
-        """Test recursive pattern in subdirectory."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        result = await tool.execute(
-            tool_call_id="test3",
-            arguments={"pattern": "src/**/*.py"}
+            arguments={"pattern": pattern}
         )
 
         assert not result.is_error
-        assert "main.py" in result.content or "src/main.py" in result.content
-        assert "utils.py" in result.content or "src/utils.py" in result.content
-        assert "test_main.py" not in result.content  # Not in src/
+        for name in expected:
+            assert name in result.content
+        for name in forbidden:
+            assert name not in result.content
+        assert result.details["count"] == count
 
     @pytest.mark.asyncio
-    async def test_specific_directory(self, temp_dir):
+    async def test_specific_directory(self, tool, glob_tree):
         """Test glob with specific path parameter."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test4",
             arguments={
-                "pattern": "*.py",
-                "path": str(temp_dir / "tests")
+                "pattern": _PATTERNS["py"],
+                "path": str(glob_tree / "tests")
             }
         )
 
@@ -110,40 +97,8 @@ class TestGlobTool:
         assert "file1.py" not in result.content  # Not in tests/
 
     @pytest.mark.asyncio
-    async def test_file_extension_pattern(self, temp_dir):
-        """Test pattern for specific file extensions."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        result = await tool.execute(
-            tool_call_id="test5",
-            arguments={"pattern": "**/*.md"}
-        )
-
-        assert not result.is_error
-        assert "readme.md" in result.content or "docs/readme.md" in result.content
-        assert "api.md" in result.content or "docs/api.md" in result.content
-        assert result.details["count"] == 2
-
-    @pytest.mark.asyncio
-    async def test_js_files_pattern(self, temp_dir):
-        """Test finding JavaScript files."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        result = await tool.execute(
-            tool_call_id="test6",
-            arguments={"pattern": "**/*.js"}
-        )
-
-        assert not result.is_error
-        assert "button.js" in result.content
-        assert "input.js" in result.content
-        assert result.details["count"] == 2
-
-    @pytest.mark.asyncio
-    async def test_no_matches(self, temp_dir):
+    async def test_no_matches(self, tool):
         """Test pattern that matches no files."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test7",
             arguments={"pattern": "*.nonexistent"}
@@ -154,10 +109,8 @@ class TestGlobTool:
         assert result.details["count"] == 0
 
     @pytest.mark.asyncio
-    async def test_missing_pattern(self, temp_dir):
+    async def test_missing_pattern(self, tool):
         """Test error when pattern is missing."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test8",
             arguments={}
@@ -167,14 +120,12 @@ class TestGlobTool:
         assert "pattern parameter is required" in result.content
 
     @pytest.mark.asyncio
-    async def test_nonexistent_directory(self, temp_dir):
+    async def test_nonexistent_directory(self, tool):
         """Test error when specified directory doesn't exist."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test9",
             arguments={
-                "pattern": "*.py",
+                "pattern": _PATTERNS["py"],
                 "path": "/nonexistent/directory"
             }
         )
@@ -183,89 +134,11 @@ class TestGlobTool:
         assert "does not exist" in result.content
 
     @pytest.mark.asyncio
-    async def test_wildcard_pattern(self, temp_dir):
-        """Test wildcard pattern matching."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        result = await tool.execute(
-            tool_call_id="test10",
-            arguments={"pattern": "file*"}
-        )
-
-        assert not result.is_error
-        assert "file1.py" in result.content
-        assert "file2.py" in result.content
-
-    @pytest.mark.asyncio
-    async def test_question_mark_pattern(self, temp_dir):
-        """Test single character wildcard (?)."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        # Create files for this test
-        (temp_dir / "a1.txt").touch()
-        (temp_dir / "a2.txt").touch()
-        (temp_dir / "b1.txt").touch()
-
-        result = await tool.execute(
-            tool_call_id="test11",
-            arguments={"pattern": "a?.txt"}
-        )
-
-        assert not result.is_error
-        assert "a1.txt" in result.content
-        assert "a2.txt" in result.content
-        assert "b1.txt" not in result.content
-
-    @pytest.mark.asyncio
-    async def test_character_class_pattern(self, temp_dir):
-        """Test character class pattern [abc]."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        # Create test files
-        (temp_dir / "data_a.txt").touch()
-        (temp_dir / "data_b.txt").touch()
-        (temp_dir / "data_c.txt").touch()
-        (temp_dir / "data_d.txt").touch()
-
-        result = await tool.execute(
-            tool_call_id="test12",
-            arguments={"pattern": "data_[abc].txt"}
-        )
-
-        assert not result.is_error
-        assert "data_a.txt" in result.content
-        assert "data_b.txt" in result.content
-        assert "data_c.txt" in result.content
-        assert "data_d.txt" not in result.content
-
-    @pytest.mark.asyncio
-    async def test_large_result_set(self, temp_dir):
-        """Test handling of large result sets (>100 files)."""
-        tool = GlobTool(working_dir=temp_dir)
-
-        # Create many files
-        many_dir = temp_dir / "many"
-        many_dir.mkdir()
-        for i in range(150):
-            (many_dir / f"file_{i:03d}.txt").touch()
-
-        result = await tool.execute(
-            tool_call_id="test13",
-            arguments={"pattern": "many/*.txt"}
-        )
-
-        assert not result.is_error
-        assert result.details["count"] == 150
-        assert "and 50 more" in result.content  # Shows truncation
-
-    @pytest.mark.asyncio
-    async def test_details_metadata(self, temp_dir):
+    async def test_details_metadata(self, tool):
         """Test that result includes proper metadata."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test14",
-            arguments={"pattern": "*.py"}
+            arguments={"pattern": _PATTERNS["py"]}
         )
 
         assert not result.is_error
@@ -273,13 +146,12 @@ class TestGlobTool:
         assert "base_dir" in result.details
         assert "count" in result.details
         assert "files" in result.details
-        assert result.details["pattern"] == "*.py"
+        assert result.details["pattern"] == _PATTERNS["py"]
         assert isinstance(result.details["files"], list)
 
     @pytest.mark.asyncio
-    async def test_on_update_callback(self, temp_dir):
+    async def test_on_update_callback(self, tool):
         """Test that on_update callback is called."""
-        tool = GlobTool(working_dir=temp_dir)
         updates = []
 
         def on_update(msg):
@@ -287,7 +159,7 @@ class TestGlobTool:
 
         result = await tool.execute(
             tool_call_id="test15",
-            arguments={"pattern": "*.py"},
+            arguments={"pattern": _PATTERNS["py"]},
             on_update=on_update
         )
 
@@ -296,13 +168,11 @@ class TestGlobTool:
         assert "Searching" in updates[0]
 
     @pytest.mark.asyncio
-    async def test_relative_paths(self, temp_dir):
+    async def test_relative_paths(self, tool):
         """Test that results use relative paths when possible."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test16",
-            arguments={"pattern": "**/*.py"}
+            arguments={"pattern": _PATTERNS["py_rec"]}
         )
 
         assert not result.is_error
@@ -311,52 +181,96 @@ class TestGlobTool:
             assert not file_path.startswith("/")
 
     @pytest.mark.asyncio
-    async def test_sorted_results(self, temp_dir):
+    async def test_sorted_results(self, tool):
         """Test that results are sorted."""
-        tool = GlobTool(working_dir=temp_dir)
-
         result = await tool.execute(
             tool_call_id="test17",
-            arguments={"pattern": "*.py"}
+            arguments={"pattern": _PATTERNS["py"]}
         )
 
         assert not result.is_error
         files = result.details["files"]
-        assert files == sorted(files)
+        assert all(map(operator.le, files, files[1:]))
 
     @pytest.mark.asyncio
-    async def test_yaml_config_files(self, temp_dir):
-        """Test finding YAML config files."""
-        tool = GlobTool(working_dir=temp_dir)
+    async def test_multiple_extensions(self, tool):
+        """Test pattern matching multiple file types."""
+        # Independent patterns can run concurrently
+        result_py, result_js = await asyncio.gather(
+            tool.execute(tool_call_id="test19a", arguments={"pattern": _PATTERNS["py_rec"]}),
+            tool.execute(tool_call_id="test19b", arguments={"pattern": _PATTERNS["js_rec"]}),
+        )
+
+        assert not result_py.is_error
+        assert not result_js.is_error
+        assert result_py.details["count"] > 0
+        assert result_js.details["count"] > 0
+
+
+class TestGlobToolExtraFiles:
+    """Test cases that create their own files."""
+
+    @pytest.fixture
+    def tool(self, temp_dir):
+        """GlobTool rooted at this test's directory."""
+        return GlobTool(working_dir=str(temp_dir))
+
+    @pytest.mark.asyncio
+    async def test_question_mark_pattern(self, tool, temp_dir):
+        """Test single character wildcard (?)."""
+        # Create files for this test
+        (temp_dir / "a1.txt").touch()
+        (temp_dir / "a2.txt").touch()
+        (temp_dir / "b1.txt").touch()
 
         result = await tool.execute(
-            tool_call_id="test18",
-            arguments={"pattern": "**/*.yaml"}
+            tool_call_id="test11",
+            arguments={"pattern": "a?.txt"}
         )
 
         assert not result.is_error
-        assert "config.yaml" in result.content
+        assert "a1.txt" in result.content
+        assert "a2.txt" in result.content
+        assert "b1.txt" not in result.content
 
     @pytest.mark.asyncio
-    async def test_multiple_extensions(self, temp_dir):
-        """Test pattern matching multiple file types."""
-        tool = GlobTool(working_dir=temp_dir)
+    async def test_character_class_pattern(self, tool, temp_dir):
+        """Test character class pattern [abc]."""
+        # Create test files
+        (temp_dir / "data_a.txt").touch()
+        (temp_dir / "data_b.txt").touch()
+        (temp_dir / "data_c.txt").touch()
+        (temp_dir / "data_d.txt").touch()
 
-        # Test with multiple patterns would require multiple calls
-        result_py = await tool.execute(
-            tool_call_id="test19a",
-            arguments={"pattern": "**/*.py"}
+        result = await tool.execute(
+            tool_call_id="test12",
+            arguments={"pattern": "data_[abc].txt"}
         )
 
-        result_js = await tool.execute(
-            tool_call_id="test19b",
-            arguments={"pattern": "**/*.js"}
+        assert not result.is_error
+        assert "data_a.txt" in result.content
+        assert "data_b.txt" in result.content
+        assert "data_c.txt" in result.content
+        assert "data_d.txt" not in result.content
+
+    @pytest.mark.asyncio
+    async def test_large_result_set(self, tool, temp_dir):
+        """Test handling of large result sets (>100 files)."""
+        # Create many files with raw os calls (no per-file Path objects)
+        many_dir = os.path.join(temp_dir, "many")
+        os.mkdir(many_dir)
+        for i in range(150):
+            fd = os.open(f"{many_dir}/file_{i:03d}.txt", os.O_WRONLY | os.O_CREAT, 0o644)
+            os.close(fd)
+
+        result = await tool.execute(
+            tool_call_id="test13",
+            arguments={"pattern": "many/*.txt"}
         )
 
-        assert not result_py.is_error
-        assert not result_js.is_error
-        assert result_py.details["count"] > 0
-        assert result_js.details["count"] > 0
+        assert not result.is_error
+        assert result.details["count"] == 150
+        assert "and 50 more" in result.content  # Shows truncation
 
 
 class TestGlobToolEdgeCases:
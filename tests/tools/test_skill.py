@@ -1,27 +1,29 @@
 """Tests for SkillTool - Dynamic skill loading tool."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
+import yaml
 
-from agenix.tools.skill import SkillTool
+from agenix.extensions.builtin.skill import SkillTool
+from agenix.extensions.builtin.skill import tool as skill_tool_module
 
+# Enough uncached SKILL.md files for discovery to use the thread pool
+_MANY_SKILLS = skill_tool_module._PARALLEL_SCAN_THRESHOLD * 2
 
-class TestSkillTool:
-    """Test cases for SkillTool."""
 
-    @pytest.fixture
-    def temp_skills_dir(self):
-        """Create temporary skills directory with test skills."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills_path = Path(tmpdir) / ".agenix" / "skills"
-            skills_path.mkdir(parents=True)
-
-            # Create test skill 1
-            skill1_dir = skills_path / "test-skill"
-            skill1_dir.mkdir()
-            (skill1_dir / "SKILL.md").write_text("""---
+@pytest.fixture(scope="module")
+def temp_skills_dir(tmp_path_factory):
+    """Create temporary skills directory with test skills.
+
+    Built once per module; tests must not modify it.
+    """
+    tmp_path = tmp_path_factory.mktemp("skills")
+    skills_path = tmp_path / ".agenix" / "skills"
+    skills_path.mkdir(parents=True)
+
+    # Create test skill 1
+    skill1_dir = skills_path / "test-skill"
+    skill1_dir.mkdir()
+    (skill1_dir / "SKILL.md").write_text("""---
 name: test-skill
 description: A test skill
 ---
@@ -37,10 +39,10 @@ This is a test skill for unit testing.
 3. Complete task
 """)
 
-            # Create test skill 2
-            skill2_dir = skills_path / "another-skill"
-            skill2_dir.mkdir()
-            (skill2_dir / "SKILL.md").write_text("""---
+    # Create test skill 2
+    skill2_dir = skills_path / "another-skill"
+    skill2_dir.mkdir()
+    (skill2_dir / "SKILL.md").write_text("""---
 name: another-skill
 description: Another test skill
 ---
@@ -50,21 +52,29 @@ description: Another test skill
 More test instructions here.
 """)
 
-            # Create skill without frontmatter (should use directory name)
-            skill3_dir = skills_path / "fallback-skill"
-            skill3_dir.mkdir()
-            (skill3_dir / "SKILL.md").write_text("""# Fallback Skill
+    # Create skill without frontmatter (should use directory name)
+    skill3_dir = skills_path / "fallback-skill"
+    skill3_dir.mkdir()
+    (skill3_dir / "SKILL.md").write_text("""# Fallback Skill
 
 This skill has no frontmatter.
 """)
 
-            yield Path(tmpdir)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def tool(temp_skills_dir):
+    """One SkillTool shared by the module; skills are scanned once."""
+    return SkillTool(working_dir=temp_skills_dir)
+
+
+class TestSkillTool:
+    """Test cases for SkillTool."""
 
     @pytest.mark.asyncio
-    async def test_load_skill_success(self, temp_skills_dir):
+    async def test_load_skill_success(self, tool):
         """Test successfully loading a skill."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test1",
             arguments={"skill_name": "test-skill"}
@@ -77,10 +87,8 @@ This skill has no frontmatter.
         assert result.details["skill_name"] == "test-skill"
 
     @pytest.mark.asyncio
-    async def test_skill_content_excludes_frontmatter(self, temp_skills_dir):
+    async def test_skill_content_excludes_frontmatter(self, tool):
         """Test that loaded skill doesn't include YAML frontmatter."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test2",
             arguments={"skill_name": "test-skill"}
@@ -94,10 +102,8 @@ This skill has no frontmatter.
         assert "Test Skill" in result.content
 
     @pytest.mark.asyncio
-    async def test_load_nonexistent_skill(self, temp_skills_dir):
+    async def test_load_nonexistent_skill(self, tool):
         """Test loading a skill that doesn't exist."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test3",
             arguments={"skill_name": "nonexistent"}
@@ -109,10 +115,8 @@ This skill has no frontmatter.
         assert "test-skill" in result.content  # Shows available skills
 
     @pytest.mark.asyncio
-    async def test_missing_skill_name_parameter(self, temp_skills_dir):
+    async def test_missing_skill_name_parameter(self, tool):
         """Test error when skill_name parameter is missing."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test4",
             arguments={}
@@ -122,10 +126,8 @@ This skill has no frontmatter.
         assert "skill_name parameter is required" in result.content
 
     @pytest.mark.asyncio
-    async def test_empty_skill_name(self, temp_skills_dir):
+    async def test_empty_skill_name(self, tool):
         """Test error with empty skill name."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test5",
             arguments={"skill_name": ""}
@@ -135,10 +137,8 @@ This skill has no frontmatter.
         assert "skill_name parameter is required" in result.content
 
     @pytest.mark.asyncio
-    async def test_multiple_skills_available(self, temp_skills_dir):
+    async def test_multiple_skills_available(self, tool):
         """Test that multiple skills can be loaded."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         # Load first skill
         result1 = await tool.execute(
             tool_call_id="test6a",
@@ -159,10 +159,8 @@ This skill has no frontmatter.
         assert "Another Skill" in result2.content
 
     @pytest.mark.asyncio
-    async def test_skill_details_metadata(self, temp_skills_dir):
+    async def test_skill_details_metadata(self, tool):
         """Test that result includes proper metadata."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test7",
             arguments={"skill_name": "test-skill"}
@@ -176,9 +174,8 @@ This skill has no frontmatter.
         assert "SKILL.md" in result.details["skill_file"]
 
     @pytest.mark.asyncio
-    async def test_on_update_callback(self, temp_skills_dir):
+    async def test_on_update_callback(self, tool):
         """Test that on_update callback is called."""
-        tool = SkillTool(working_dir=temp_skills_dir)
         updates = []
 
         def on_update(msg):
@@ -196,10 +193,8 @@ This skill has no frontmatter.
         assert "test-skill" in updates[0]
 
     @pytest.mark.asyncio
-    async def test_skill_source_indicator(self, temp_skills_dir):
+    async def test_skill_source_indicator(self, tool):
         """Test that skill source is indicated in result."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test9",
             arguments={"skill_name": "test-skill"}
@@ -211,10 +206,8 @@ This skill has no frontmatter.
         assert result.details["source"] in ["builtin", "custom"]
 
     @pytest.mark.asyncio
-    async def test_skill_instructions_footer(self, temp_skills_dir):
+    async def test_skill_instructions_footer(self, tool):
         """Test that skill includes instruction footer."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         result = await tool.execute(
             tool_call_id="test10",
             arguments={"skill_name": "test-skill"}
@@ -225,10 +218,8 @@ This skill has no frontmatter.
         assert "Skill source:" in result.content
 
     @pytest.mark.asyncio
-    async def test_fallback_to_directory_name(self, temp_skills_dir):
+    async def test_fallback_to_directory_name(self, tool):
         """Test skill name fallback to directory name when no frontmatter."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         # Should be available with directory name
         result = await tool.execute(
             tool_call_id="test11",
@@ -239,23 +230,21 @@ This skill has no frontmatter.
         assert "Fallback Skill" in result.content
 
     @pytest.mark.asyncio
-    async def test_tool_description_includes_available_skills(self, temp_skills_dir):
+    async def test_tool_description_includes_available_skills(self, tool):
         """Test that tool description includes list of available skills."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         assert "test-skill" in tool.description
         assert "another-skill" in tool.description
 
     @pytest.mark.asyncio
-    async def test_tool_parameters_enum(self, temp_skills_dir):
+    async def test_tool_parameters_enum(self, tool):
         """Test that tool parameters include skill names as enum."""
-        tool = SkillTool(working_dir=temp_skills_dir)
-
         enum_values = tool.parameters["properties"]["skill_name"]["enum"]
 
         assert "test-skill" in enum_values
         assert "another-skill" in enum_values
         assert "fallback-skill" in enum_values
+        # Same order as the description's skill list
+        assert enum_values == sorted(enum_values)
 
 
 class TestSkillToolBuiltinSkills:
@@ -272,17 +261,16 @@ class TestSkillToolBuiltinSkills:
         assert len(tool._available_skills) >= 0  # May have builtin skills
 
     @pytest.mark.asyncio
-    async def test_skill_priority_project_over_builtin(self):
+    async def test_skill_priority_project_over_builtin(self, tmp_path):
         """Test that project skills override built-in skills with same name."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir)
-            skills_dir = project_dir / ".agenix" / "skills"
-            skills_dir.mkdir(parents=True)
-
-            # Create a skill with potentially conflicting name
-            skill_dir = skills_dir / "custom-skill"
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text("""---
+        project_dir = tmp_path
+        skills_dir = project_dir / ".agenix" / "skills"
+        skills_dir.mkdir(parents=True)
+
+        # Create a skill with potentially conflicting name
+        skill_dir = skills_dir / "custom-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
 name: custom-skill
 description: Project-local custom skill
 ---
@@ -292,49 +280,154 @@ description: Project-local custom skill
 Project-local version.
 """)
 
-            tool = SkillTool(working_dir=project_dir)
+        tool = SkillTool(working_dir=project_dir)
+
+        # If the skill exists, it should be the project version
+        if "custom-skill" in tool._available_skills:
+            result = await tool.execute(
+                tool_call_id="priority1",
+                arguments={"skill_name": "custom-skill"}
+            )
+
+            assert not result.is_error
+            assert "Project-local version" in result.content
+
+
+class TestFrontmatterParsing:
+    """Test the SKILL.md frontmatter helpers."""
+
+    def test_split_frontmatter(self):
+        """Test that only a closing marker line ends the frontmatter."""
+        split = skill_tool_module._split_frontmatter
+
+        assert split("---\nname: a\ndescription: x---y\n---\n\nBody\n") == (
+            "name: a\ndescription: x---y", "\nBody\n"
+        )
+        assert split("---\nname: a\n----\nstill frontmatter\n---\nBody") == (
+            "name: a\n----\nstill frontmatter", "Body"
+        )
+        assert split("---\n---\nBody") == ("", "Body")
+        assert split("# Title\n") == (None, "# Title\n")
+        assert split("---\nname: unclosed\n") == (None, "---\nname: unclosed\n")
+
+    def test_read_small_reads_whole_file(self, tmp_path):
+        """Test that files larger than one read chunk are read completely."""
+        path = tmp_path / "SKILL.md"
+        text = "---\nname: big\n---\n" + "é" * 70000
+        path.write_bytes(text.encode("utf-8"))
+
+        assert skill_tool_module._read_small(str(path)) == text
+
+    def test_frontmatter_parse_cache(self, tmp_path, monkeypatch):
+        """Test that unchanged SKILL.md files are not re-parsed and edits are picked up."""
+        skill_dir = tmp_path / ".agenix" / "skills" / "cached"
+        skill_dir.mkdir(parents=True)
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\nname: cached-skill\n---\n\nBody.\n")
+
+        parsed = []
+        parse = skill_tool_module._parse_frontmatter_name
+        monkeypatch.setattr(
+            skill_tool_module, "_parse_frontmatter_name",
+            lambda path: parsed.append(path) or parse(path)
+        )
+        SkillTool(working_dir=tmp_path)
+        tool = SkillTool(working_dir=tmp_path)
+
+        assert parsed.count(str(skill_file)) == 1
+        assert "cached-skill" in tool._available_skills
+
+        # A rewrite with a different size changes the cache key
+        skill_file.write_text("---\nname: renamed-skill\n---\n\nBody.\n")
+        tool = SkillTool(working_dir=tmp_path)
 
-            # If the skill exists, it should be the project version
-            if "custom-skill" in tool._available_skills:
-                result = await tool.execute(
-                    tool_call_id="priority1",
-                    arguments={"skill_name": "custom-skill"}
-                )
+        assert "renamed-skill" in tool._available_skills
+        assert "cached-skill" not in tool._available_skills
 
-                assert not result.is_error
-                assert "Project-local version" in result.content
+    def test_non_string_yaml_name(self, tmp_path):
+        """Test that a YAML-typed name is used as a string skill name."""
+        skill_dir = tmp_path / ".agenix" / "skills" / "numbered"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: 123\ndescription: >\n  folded\n---\n\nBody.\n"
+        )
+
+        tool = SkillTool(working_dir=tmp_path)
+
+        assert "123" in tool._available_skills
+
+    def test_fast_frontmatter(self):
+        """Test the flat frontmatter parser and its fallback to YAML."""
+        fast = skill_tool_module._fast_frontmatter
+
+        assert fast("\nname: demo\ndescription: 'Says: hi'\n") == {
+            "name": "demo", "description": "Says: hi"
+        }
+        # Block scalars, flow collections and nesting need real YAML
+        assert fast("\nname: demo\ndescription: >\n  folded\n") is None
+        assert fast("\nname: demo\ntags: [a, b]\n") is None
+        assert fast("\nname: demo\nmeta:\n  key: value\n") is None
+        # Escaped quotes and typed scalars are left to YAML
+        assert fast("\nname: 'it''s'\n") is None
+        assert fast('\nname: "a\\"b"\n') is None
+        assert fast("\nname: 123\n") is None
+        assert fast("\nname: true\n") is None
+
+    @pytest.mark.parametrize("line,expected", [
+        ("name: 123", "123"),
+        ("name: 'it''s'", "it's"),
+        ('name: "a\\"b"', 'a"b'),
+        ("name: plain-name", "plain-name"),
+        ('"name": quoted-name', "quoted-name"),
+        # Invalid YAML yields no name on either path
+        ("name: foo: bar", None),
+        ("name: @foo", None),
+        ("name: %foo", None),
+    ])
+    def test_name_same_with_or_without_yaml(self, tmp_path, line, expected):
+        """Test that the fast path and the YAML fallback yield the same name."""
+        names = set()
+        for extra in ("", "description: >\n  folded\n"):
+            skill_file = tmp_path / f"SKILL{len(extra)}.md"
+            skill_file.write_text(f"---\n{line}\n{extra}---\n\nBody.\n")
+            names.add(skill_tool_module._parse_frontmatter_name(str(skill_file)))
+
+        assert names == {expected}
+
+    def test_uses_c_yaml_loader(self):
+        """Test that frontmatter parsing uses the C loader when available."""
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert skill_tool_module._yaml_loader() is expected
 
 
 class TestSkillToolEdgeCases:
     """Test edge cases and error handling."""
 
     @pytest.mark.asyncio
-    async def test_no_skills_available(self):
+    async def test_no_skills_available(self, tmp_path):
         """Test tool with no skills available."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Empty project directory
-            tool = SkillTool(working_dir=Path(tmpdir))
+        # Empty project directory
+        tool = SkillTool(working_dir=tmp_path)
 
-            # May have built-in skills, but at least shouldn't crash
-            result = await tool.execute(
-                tool_call_id="edge1",
-                arguments={"skill_name": "any-skill"}
-            )
+        # May have built-in skills, but at least shouldn't crash
+        result = await tool.execute(
+            tool_call_id="edge1",
+            arguments={"skill_name": "any-skill"}
+        )
 
-            # Should error about skill not found
-            assert result.is_error
+        # Should error about skill not found
+        assert result.is_error
 
     @pytest.mark.asyncio
-    async def test_corrupted_skill_file(self):
+    async def test_corrupted_skill_file(self, tmp_path):
         """Test handling of corrupted skill file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills_path = Path(tmpdir) / ".agenix" / "skills"
-            skills_path.mkdir(parents=True)
-
-            # Create skill with invalid YAML
-            skill_dir = skills_path / "corrupt-skill"
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text("""---
+        skills_path = tmp_path / ".agenix" / "skills"
+        skills_path.mkdir(parents=True)
+
+        # Create skill with invalid YAML
+        skill_dir = skills_path / "corrupt-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
 name: corrupt-skill
 description: [unclosed array
 ---
@@ -342,46 +435,44 @@ description: [unclosed array
 Content
 """)
 
-            tool = SkillTool(working_dir=Path(tmpdir))
+        tool = SkillTool(working_dir=tmp_path)
 
-            # Tool should still initialize (may skip corrupt skills)
-            assert tool is not None
+        # Tool should still initialize (may skip corrupt skills)
+        assert tool is not None
 
     @pytest.mark.asyncio
-    async def test_skill_file_without_content(self):
+    async def test_skill_file_without_content(self, tmp_path):
         """Test skill file with only frontmatter."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills_path = Path(tmpdir) / ".agenix" / "skills"
-            skills_path.mkdir(parents=True)
+        skills_path = tmp_path / ".agenix" / "skills"
+        skills_path.mkdir(parents=True)
 
-            skill_dir = skills_path / "empty-skill"
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text("""---
+        skill_dir = skills_path / "empty-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
 name: empty-skill
 description: Skill with no content
 ---
 """)
 
-            tool = SkillTool(working_dir=Path(tmpdir))
+        tool = SkillTool(working_dir=tmp_path)
 
-            result = await tool.execute(
-                tool_call_id="edge3",
-                arguments={"skill_name": "empty-skill"}
-            )
+        result = await tool.execute(
+            tool_call_id="edge3",
+            arguments={"skill_name": "empty-skill"}
+        )
 
-            # Should load successfully, even if content is minimal
-            assert not result.is_error
+        # Should load successfully, even if content is minimal
+        assert not result.is_error
 
     @pytest.mark.asyncio
-    async def test_unicode_in_skill_content(self):
+    async def test_unicode_in_skill_content(self, tmp_path):
         """Test skill with Unicode content."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills_path = Path(tmpdir) / ".agenix" / "skills"
-            skills_path.mkdir(parents=True)
+        skills_path = tmp_path / ".agenix" / "skills"
+        skills_path.mkdir(parents=True)
 
-            skill_dir = skills_path / "unicode-skill"
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text("""---
+        skill_dir = skills_path / "unicode-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
 name: unicode-skill
 description: Skill with Unicode
 ---
@@ -393,27 +484,26 @@ description: Skill with Unicode
 - Special chars: © ® ™
 """, encoding="utf-8")
 
-            tool = SkillTool(working_dir=Path(tmpdir))
+        tool = SkillTool(working_dir=tmp_path)
 
-            result = await tool.execute(
-                tool_call_id="edge4",
-                arguments={"skill_name": "unicode-skill"}
-            )
+        result = await tool.execute(
+            tool_call_id="edge4",
+            arguments={"skill_name": "unicode-skill"}
+        )
 
-            assert not result.is_error
-            assert "中文字符" in result.content
-            assert "🚀" in result.content
+        assert not result.is_error
+        assert "中文字符" in result.content
+        assert "🚀" in result.content
 
     @pytest.mark.asyncio
-    async def test_skill_with_code_blocks(self):
+    async def test_skill_with_code_blocks(self, tmp_path):
         """Test skill containing code blocks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills_path = Path(tmpdir) / ".agenix" / "skills"
-            skills_path.mkdir(parents=True)
+        skills_path = tmp_path / ".agenix" / "skills"
+        skills_path.mkdir(parents=True)
 
-            skill_dir = skills_path / "code-skill"
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text("""---
+        skill_dir = skills_path / "code-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
 name: code-skill
 description: Skill with code examples
 ---
@@ -430,16 +520,45 @@ def hello():
 End of skill.
 """)
 
-            tool = SkillTool(working_dir=Path(tmpdir))
+        tool = SkillTool(working_dir=tmp_path)
 
-            result = await tool.execute(
-                tool_call_id="edge5",
-                arguments={"skill_name": "code-skill"}
-            )
+        result = await tool.execute(
+            tool_call_id="edge5",
+            arguments={"skill_name": "code-skill"}
+        )
 
-            assert not result.is_error
-            assert "```python" in result.content
-            assert "def hello():" in result.content
+        assert not result.is_error
+        assert "```python" in result.content
+        assert "def hello():" in result.content
+
+    @pytest.fixture
+    def many_skills_dir(self, tmp_path):
+        """Project with enough skills to reach the threaded scan."""
+        skills_path = tmp_path / ".agenix" / "skills"
+        for i in range(_MANY_SKILLS):
+            skill_dir = skills_path / f"dir-{i}"
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"---\nname: skill-{i}\n---\n\nBody {i}.\n")
+        return tmp_path
+
+    def test_many_skills_scanned_in_parallel(self, many_skills_dir):
+        """Test discovery of enough skills to use the threaded scan."""
+        tool = SkillTool(working_dir=many_skills_dir)
+
+        for i in range(_MANY_SKILLS):
+            assert f"skill-{i}" in tool._available_skills
+
+    def test_cached_scan_skips_thread_pool(self, many_skills_dir, monkeypatch):
+        """Test that rescanning unchanged skills does not start a thread pool."""
+        SkillTool(working_dir=many_skills_dir)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("thread pool started for cached skills")
+
+        monkeypatch.setattr(skill_tool_module, "ThreadPoolExecutor", no_pool)
+        tool = SkillTool(working_dir=many_skills_dir)
+
+        assert "skill-0" in tool._available_skills
 
 
 if __name__ == "__main__":
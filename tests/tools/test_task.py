@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from agenix.tools.task import TaskTool
+from agenix.extensions.builtin.task import TaskTool
 
 
 class TestTaskToolBasics: